@@ -16,7 +16,7 @@
 # under the License.
 # pylint: disable=unused-import
 """The TensorIR schedule class"""
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from tvm._ffi import register_object as _register_object
 from tvm.error import TVMError, register_error
@@ -37,6 +37,8 @@ class ScheduleError(TVMError):
 class LoopRV(Object):
     """A random variable that refers to a loop"""
 
+    __slots__ = []
+
     def __init__(self) -> None:
         """Construct a new LoopRV."""
         self.__init_handle_by_constructor__(
@@ -48,6 +50,8 @@ class LoopRV(Object):
 class BlockRV(Object):
     """A random variable that refers to a block"""
 
+    __slots__ = []
+
     def __init__(self) -> None:
         """Construct a new BlockRV."""
         self.__init_handle_by_constructor__(
@@ -81,6 +85,8 @@ class Schedule(Object):
     Link to tutorial: https://tvm.apache.org/docs/tutorials/language/schedule_primitives.html
     """
 
+    __slots__ = []
+
     ERROR_RENDER_LEVEL = {
         "detail": 0,
         "fast": 1,
@@ -124,7 +130,8 @@ class Schedule(Object):
                 debug_mode = 0
         if not isinstance(debug_mode, int):
             raise TypeError(f"`debug_mode` should be integer or boolean, but gets: {debug_mode}")
-        if error_render_level not in Schedule.ERROR_RENDER_LEVEL:
+        error_render_level_code = Schedule.ERROR_RENDER_LEVEL.get(error_render_level)
+        if error_render_level_code is None:
             raise ValueError(
                 'error_render_level can be "detail", "fast", or "none", but got: '
                 + f"{error_render_level}"
@@ -133,7 +140,7 @@ class Schedule(Object):
             _ffi_api.ConcreteSchedule,  # type: ignore # pylint: disable=no-member
             mod,
             debug_mode,
-            Schedule.ERROR_RENDER_LEVEL.get(error_render_level),
+            error_render_level_code,
         )
 
     ########## Utilities ##########
@@ -293,6 +300,37 @@ class Schedule(Object):
         """
         return _ffi_api.ScheduleGetLoops(self, block)  # type: ignore # pylint: disable=no-member
 
+    def get_block_loops(
+        self,
+        name: str,
+        func_name: str = "main",
+    ) -> Tuple[BlockRV, List[LoopRV]]:
+        """Retrieve a block in a specific function with its name, as well as its parent loops
+        in its scope, from outer to inner. It is equivalent to calling `get_block` followed by
+        `get_loops`, but only crosses the FFI boundary once.
+
+        Parameters
+        ----------
+        name : str
+            The name of the block
+        func_name : str = "main"
+            The name of the function
+
+        Returns
+        -------
+        block : BlockRV
+            The block retrieved
+            IndexError is raised if 0 or multiple blocks exist with the specific name.
+        loops : List[LoopRV]
+            A list of loops above the block in its scope, from outer to inner
+        """
+        block, loops = _ffi_api.ScheduleGetBlockLoops(  # type: ignore # pylint: disable=no-member
+            self,
+            name,
+            func_name,
+        )
+        return block, loops
+
     ########## Schedule: Transform loops ##########
     def fuse(self, *loops: List[LoopRV]) -> LoopRV:
         """Fuse a list of consecutive loops into one. It requires:
@@ -707,3 +745,5 @@ class Schedule(Object):
 @_register_object("tir.ConcreteSchedule")
 class ConcreteSchedule(Schedule):
     """A concrete schedule class of TensorIR. Do not use directly, use tvm.tir.Schedule instead."""
+
+    __slots__ = []
@@ -307,6 +307,11 @@ class BaseInliner : public StmtExprMutator {
     }
     Block tgt_block = Downcast<Block>(StmtExprMutator::VisitStmt_(block));
     bool is_scope_root = src_block.get() == scope_root_sref_->stmt;
+    if (!is_scope_root && tgt_block.same_as(src_block)) {
+      // The subtree is untouched by inlining, so neither the block signature needs
+      // re-inspection, nor the block needs to be copied
+      return std::move(tgt_block);
+    }
     tgt_block = UpdateBuffersInBlockSignature(std::move(tgt_block), is_scope_root);
     block_reuse.Set(src_block, tgt_block);
     return std::move(tgt_block);
@@ -280,9 +280,20 @@ class LoopPropertyError : public ScheduleError {
                                 const ForNode* rf_loop, const Block& block,
                                 const std::unordered_set<const VarNode*>& data_par_loop_vars,
                                 const std::unordered_set<const VarNode*>& reduce_loop_vars) {
-    Array<BlockRealize> children_of_outermost_loop =
-        GetChildBlockRealizeOnSRefTree(self->stmt2ref.at(loops[0].get()));
-    if (!children_of_outermost_loop[0]->block.same_as(block)) {
+    // Only the first child block of the outermost loop matters here, so the search stops there
+    // instead of collecting all the child blocks under the outermost loop
+    struct FirstChildBlockFinder : public StmtVisitor {
+      void VisitStmt(const Stmt& stmt) final {
+        if (result == nullptr) {
+          StmtVisitor::VisitStmt(stmt);
+        }
+      }
+      void VisitStmt_(const BlockRealizeNode* block_realize) final { result = block_realize; }
+      const BlockRealizeNode* result = nullptr;
+    } first_child_finder;
+    first_child_finder(loops[0]->body);
+    ICHECK(first_child_finder.result != nullptr);
+    if (!first_child_finder.result->block.same_as(block)) {
       throw LoopPropertyError(self->mod, loops[0], kNotFirstChildBlockOfOutermostLoop);
     }
 
@@ -300,7 +311,10 @@ class LoopPropertyError : public ScheduleError {
         continue;
       } else if (reduction_touched) {
         if (!meet_reduction_loop) {
-          CheckGetSingleChildBlockRealizeOnSRefTree(self, self->stmt2ref.at(loop.get()));
+          // The rfactor loop has already been checked to have a single child block by the caller
+          if (loop.get() != rf_loop) {
+            CheckGetSingleChildBlockRealizeOnSRefTree(self, self->stmt2ref.at(loop.get()));
+          }
           meet_reduction_loop = true;
         }
         continue;
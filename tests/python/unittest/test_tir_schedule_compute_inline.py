@@ -249,6 +249,16 @@ def test_compute_inline_as_dce():
     assert sch.get(block_c).name_hint == "C"
 
 
+def test_compute_inline_untouched_block_reused():
+    sch = tir.Schedule(elementwise_standalone, debug_mode=True)
+    block_b = sch.get_block("B")
+    block_c = sch.get_block("C")
+    block_c_stmt = sch.get(block_c)
+    sch.compute_inline(block_b)
+    # "C" does not read the inlined buffer, so it is left as is
+    assert sch.get(block_c).same_as(block_c_stmt)
+
+
 def test_compute_inline_multi_consumer():
     sch = tir.Schedule(elementwise_multi_producer_consumer, debug_mode=True)
     block_b = sch.get_block("B")
@@ -80,6 +80,18 @@ def test_tir_schedule_get_loops():
     assert sch.get(k).loop_var.name == "k"
 
 
+def test_tir_schedule_get_block_loops():
+    # Tests:
+    # - Schedule.get_block_loops
+    # - Schedule.get
+    sch = tir.Schedule(matmul, debug_mode=True)
+    block_rv, (i, j, k) = sch.get_block_loops(name="update")
+    assert sch.get(block_rv).name_hint == "update"
+    assert sch.get(i).loop_var.name == "i"
+    assert sch.get(j).loop_var.name == "j"
+    assert sch.get(k).loop_var.name == "k"
+
+
 def test_tir_schedule_copy():
     # Tests:
     # - Schedule.copy